@@ -1,16 +1,41 @@
 """Generate the code reference pages and navigation."""
 
 import logging
+import os
 import sys
 from pathlib import Path
 
 import mkdocs_gen_files
 
+# Output directory for the generated pages, joined with plain string ops
+REF_BASE = "reference"
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _scan_py(root):
+    """Recursively yield ``os.DirEntry`` objects for documentable Python files below ``root``.
+
+    Test files and private modules (including ``__main__.py``) are skipped by name
+    so they never reach the (more expensive) path handling in the caller.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir():
+                yield from _scan_py(entry.path)
+                continue
+            name = entry.name
+            if not name.endswith(".py") or not entry.is_file():
+                continue
+            if "test" in name or name.startswith("_") and name != "__init__.py":
+                continue
+            yield entry
+
+
 def generate_reference_pages():
     """Generate reference documentation for Python modules."""
     nav = mkdocs_gen_files.Nav()
@@ -25,62 +50,64 @@ def generate_reference_pages():
         logger.error(f"Source path {src} is not a directory")
         sys.exit(1)
     
-    python_files = list(src.rglob("*.py"))
-    if not python_files:
-        logger.warning(f"No Python files found in {src}")
-        return
-    
-    logger.info(f"Found {len(python_files)} Python files to process")
+    # Derive module and doc paths with plain string ops instead of re-parsing
+    # every file path through relative_to()/with_suffix()
+    src_prefix = os.fspath(src) + os.sep
     
-    for path in sorted(python_files):
+    # Single streaming pass: write each stub page as soon as the scan finds it
+    # and only buffer the small nav entries, which are sorted at the end
+    nav_entries = []
+    _open = mkdocs_gen_files.open
+    _set_edit_path = mkdocs_gen_files.set_edit_path
+    for entry in _scan_py(src):
+        path = Path(entry.path)
+        rel_no_ext = entry.path.removeprefix(src_prefix)[:-3]  # strip ".py"
+        parts = tuple(rel_no_ext.split(os.sep))
+        
+        # Handle special files
+        if parts[-1] == "__init__":
+            # Convert __init__.py to index.md
+            parts = parts[:-1]
+            doc_path = "/".join((*parts, "index.md"))
+        else:
+            doc_path = "/".join(parts) + ".md"
+        
+        if not parts:
+            logger.debug(f"Skipping root __init__.py: {path}")
+            continue
+        
+        full_doc_path = f"{REF_BASE}/{doc_path}"
+        ident = ".".join(parts)
+        # Writing the page is the only step that can realistically fail
         try:
-            # Skip test files and private modules
-            if "test" in path.name or path.name.startswith("_") and path.name != "__init__.py":
-                logger.debug(f"Skipping {path}")
-                continue
-            
-            module_path = path.relative_to(src).with_suffix("")
-            doc_path = path.relative_to(src).with_suffix(".md")
-            full_doc_path = Path("reference", doc_path)
-            
-            parts = tuple(module_path.parts)
-            
-            # Handle special files
-            if parts[-1] == "__init__":
-                # Convert __init__.py to index.md
-                parts = parts[:-1]
-                doc_path = doc_path.with_name("index.md")
-                full_doc_path = full_doc_path.with_name("index.md")
-            elif parts[-1] == "__main__":
-                logger.debug(f"Skipping __main__ module: {path}")
-                continue
-            
-            if not parts:
-                logger.debug(f"Skipping root __init__.py: {path}")
-                continue
-            
-            nav[parts] = doc_path.as_posix()
-            
-            # Generate documentation file
-            with mkdocs_gen_files.open(full_doc_path, "w") as fd:
-                ident = ".".join(parts)
+            with _open(full_doc_path, "w") as fd:
                 fd.write(f"::: {ident}")
             
-            mkdocs_gen_files.set_edit_path(full_doc_path, path)
-            logger.debug(f"Generated documentation for {ident}")
-            
-        except Exception as e:
+            _set_edit_path(full_doc_path, path)
+        except OSError as e:
             logger.error(f"Failed to process {path}: {e}")
             # Continue processing other files instead of failing completely
             continue
+        
+        nav_entries.append((entry.path, parts, doc_path))
+        logger.debug(f"Generated documentation for {ident}")
+    
+    if not nav_entries:
+        logger.warning(f"No documentable Python files found in {src}")
+        return
+    
+    # Nav keeps insertion order, so add entries sorted by source path
+    nav_entries.sort()
+    for _, parts, doc_path in nav_entries:
+        nav[parts] = doc_path
     
     # Generate navigation file
     try:
-        with mkdocs_gen_files.open("reference/SUMMARY.md", "w") as nav_file:
-            nav_file.writelines(nav.build_literate_nav())
+        with mkdocs_gen_files.open(f"{REF_BASE}/SUMMARY.md", "w") as nav_file:
+            nav_file.write("".join(nav.build_literate_nav()))
         
-        # Count processed modules by counting nav items
-        module_count = len([k for k in nav.items()])
+        # Every generated page has exactly one nav entry
+        module_count = len(nav_entries)
         logger.info(f"Generated reference documentation for {module_count} modules")
     except Exception as e:
         logger.error(f"Failed to generate navigation file: {e}")
@@ -19,10 +19,15 @@ Environment variables:
     JOURNAL_DEFAULT_REPO: Default GitHub repository in owner/repo format
     JOURNAL_GITHUB_ORGS: Comma-separated list of GitHub organizations to search
     JOURNAL_GITHUB_USER: GitHub username or '@me' for authenticated user
+    JOURNAL_CACHE_DIR: Directory for cached GitHub lookups
+        (default: $XDG_CACHE_HOME/journal-lib or ~/.cache/journal-lib)
 """
 
 import os
+import re
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 
@@ -39,26 +44,42 @@ class JournalConfig:
     notes_dir: Path = field(
         default_factory=lambda: Path(os.getenv("JOURNAL_NOTES_DIR", str(Path.home() / "notes")))
     )
-    default_repo: str = field(default_factory=lambda: os.getenv("JOURNAL_DEFAULT_REPO", ""))
     github_orgs: list[str] = field(
         default_factory=lambda: os.getenv("JOURNAL_GITHUB_ORGS", "digitalgedacht,nexiles").split(
             ","
         )
     )
     github_user: str = field(default_factory=lambda: os.getenv("JOURNAL_GITHUB_USER", "@me"))
+    cache_dir: Path = field(
+        default_factory=lambda: Path(
+            os.getenv("JOURNAL_CACHE_DIR")
+            or Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "journal-lib"
+        )
+    )
 
     def __post_init__(self):
         """Validate configuration after initialization."""
         # Ensure notes_dir is a Path object
         if isinstance(self.notes_dir, str):
             self.notes_dir = Path(self.notes_dir)
+        if isinstance(self.cache_dir, str):
+            self.cache_dir = Path(self.cache_dir)
 
         # Clean up org list (remove empty strings and whitespace)
         self.github_orgs = [org.strip() for org in self.github_orgs if org.strip()]
 
-        # If no default_repo is set, try to detect it from current directory
-        if not self.default_repo:
-            self.default_repo = self._detect_default_repo()
+    @cached_property
+    def default_repo(self) -> str:
+        """
+        Default GitHub repository in owner/repo format.
+
+        Taken from JOURNAL_DEFAULT_REPO, or detected from the current git repository
+        on first access, so that creating a config does not spawn ``git``.
+
+        :return: Repository name in owner/repo format or empty string if not detected
+        :rtype: str
+        """
+        return os.getenv("JOURNAL_DEFAULT_REPO", "") or self._detect_default_repo()
 
     def _detect_default_repo(self) -> str:
         """
@@ -115,23 +136,54 @@ class JournalConfig:
         Returns:
             Path object pointing to daily note file
         """
-        import re
-        from datetime import datetime
-
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = datetime.now().date().isoformat()
 
-        # Security: Validate date format to prevent path traversal
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
-            raise ValueError("Invalid date format. Expected YYYY-MM-DD")
+        return _daily_note_path(str(self.notes_dir), date)
 
-        # Additional validation of date value
-        try:
-            datetime.strptime(date, "%Y-%m-%d")
-        except ValueError as e:
-            raise ValueError("Invalid date value") from e
 
-        return self.notes_dir / "daily" / f"{date}.md"
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+@lru_cache(maxsize=32)
+def _date_error(date: str) -> str | None:
+    """Check that date is a valid date in YYYY-MM-DD format.
+
+    The cheap regex check rejects other shapes before ``strptime`` validates
+    the calendar date. Results are memoized per date string.
+
+    Args:
+        date: Date string to check
+
+    Returns:
+        None if the date is valid, otherwise the reason it is invalid
+    """
+    if not _DATE_RE.match(date):
+        return "Invalid date format. Expected YYYY-MM-DD"
+    try:
+        datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        return "Invalid date value"
+    return None
+
+
+@lru_cache(maxsize=32)
+def _daily_note_path(notes_dir: str, date: str) -> Path:
+    """Validate date and build the daily note path below notes_dir.
+
+    Args:
+        notes_dir: Notes directory as a string (hashable cache key)
+        date: Date in YYYY-MM-DD format
+
+    Returns:
+        Path object pointing to daily note file
+    """
+    # Security: Validate date format to prevent path traversal
+    error = _date_error(date)
+    if error:
+        raise ValueError(error)
+
+    return Path(notes_dir) / "daily" / f"{date}.md"
 
 
 # Global configuration instance
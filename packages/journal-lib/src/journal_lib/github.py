@@ -4,11 +4,20 @@ import json
 import re
 import subprocess
 import sys
-from datetime import datetime
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
-from .config import config
+from .config import _date_error, config
+
+try:
+    # Optional faster JSON parser, used when installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 # Section headers for daily review
 SECTION_ISSUES_CREATED = "**Heute erstellte Issues:**"
@@ -17,6 +26,46 @@ SECTION_ISSUES_CLOSED = "**Heute geschlossene Issues:**"
 SECTION_ISSUES_WORKED = "**Heute bearbeitet:**"
 SECTION_PRS_MERGED = "**Heute gemergte PRs:**"
 
+# JSON fields requested from gh when viewing a single issue or PR
+_ISSUE_FIELDS = "number,title,url,state"
+
+# GraphQL node fields selected by each kind of search
+_ISSUE_NODE_FIELDS = "... on Issue { number title url state }"
+_PR_NODE_FIELDS = "... on PullRequest { number title url state createdAt mergedAt }"
+
+# Existing issue/PR links in old and new format, capturing the repository
+# Use specific patterns to prevent ReDoS vulnerabilities
+_REPO_LINK_RE = re.compile(
+    r"\[(?:(?:Issue|PR) #|(?:[a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100}#))\d{1,10}\]\(https://github\.com/([a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100})/"
+)
+
+# Longest possible link text matched by _REPO_LINK_RE: "[" + owner/repo + "#" + number
+_REPO_LINK_MAX_TEXT = 1 + 100 + 1 + 100 + 1 + 10
+
+# Formatted GitHub issue links without checkmark, old (Issue #123) and new (owner/repo#123) format
+# Use specific patterns to prevent ReDoS vulnerabilities
+_ISSUE_LINK_RE = re.compile(
+    r"\[(?:Issue #|(?:[a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100}#))(\d{1,10})\]\((https://github\.com/[a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100}/issues/\d{1,10})\) -- (?!✅)(.{1,500})"
+)
+
+# Unformatted references (not already in markdown links), capturing type and number
+# Limit number length to prevent ReDoS
+_UNFORMATTED_REF_RE = re.compile(r"(?<!\[)(Issue|PR) #(\d{1,10})(?!\]\()(?![^\[]*\]\()")
+
+# Either of the two patterns above, so all references are collected in one scan
+_ALL_REFS_RE = re.compile(f"{_ISSUE_LINK_RE.pattern}|{_UNFORMATTED_REF_RE.pattern}")
+
+# GitHub URL (github.com or www.github.com), capturing the repository
+# Use more specific, non-backtracking pattern to prevent ReDoS
+_REPO_URL_RE = re.compile(
+    r"(?i:https?://(?:www\.)?github\.com)/([a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100})"
+)
+
+# Daily Review section up to the next heading or end of content (keeping a final newline).
+# Skips whole lines and only checks for a heading after each newline, instead of
+# testing a lookahead at every character with a lazy DOTALL match.
+_DAILY_REVIEW_RE = re.compile(r"## Daily Review\n\n[^\n]*(?:\n(?!###|## |\Z)[^\n]*)*")
+
 
 def run_gh_command(cmd: list[str], single: bool = False) -> list[dict[str, Any]] | dict[str, Any]:
     """Run GitHub CLI command and return JSON result.
@@ -32,19 +81,34 @@ def run_gh_command(cmd: list[str], single: bool = False) -> list[dict[str, Any]]
     if not cmd or cmd[0] != "gh":
         raise ValueError("Only GitHub CLI commands are allowed")
 
-    allowed_commands = ["issue", "pr", "repo", "auth"]
+    allowed_commands = ["issue", "pr", "repo", "auth", "api"]
     if len(cmd) < 2 or cmd[1] not in allowed_commands:
         raise ValueError(f"Unsupported gh command: {cmd[1] if len(cmd) > 1 else 'none'}")
 
+    # Only GraphQL queries are needed from gh api, not arbitrary REST calls
+    if cmd[1] == "api" and (len(cmd) < 3 or cmd[2] != "graphql"):
+        raise ValueError(f"Unsupported gh api endpoint: {cmd[2] if len(cmd) > 2 else 'none'}")
+
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout) if result.stdout.strip() else ([] if not single else {})
+        # Keep stdout as bytes: the JSON parser decodes UTF-8 itself, no separate decoding pass
+        result = subprocess.run(cmd, capture_output=True, check=True)
+        data = _json_loads(result.stdout) if result.stdout.strip() else ([] if not single else {})
         return data
     except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", "replace") if isinstance(e.stderr, bytes) else e.stderr
         error_msg = (
-            f"GitHub CLI error: {e.stderr or e}. Check if 'gh' is installed and authenticated."
+            f"GitHub CLI error: {stderr or e}. Check if 'gh' is installed and authenticated."
         )
         print(error_msg, file=sys.stderr)
+        # gh api graphql also exits non-zero when only part of the query failed,
+        # e.g. one unknown issue number; the data it did resolve is still on stdout
+        if cmd[1] == "api" and e.stdout and e.stdout.strip():
+            try:
+                data = _json_loads(e.stdout)
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and data.get("data"):
+                return data
         return {} if single else []
     except json.JSONDecodeError as e:
         print(f"Invalid JSON response from GitHub CLI: {e}", file=sys.stderr)
@@ -66,10 +130,14 @@ def detect_repo_from_content(content: str) -> str:
     if not content or not isinstance(content, str):
         return config.default_repo
 
-    # Look for existing GitHub links to infer repo (handle both old and new formats)
-    # Use specific patterns to prevent ReDoS vulnerabilities
-    link_pattern = r"\[(?:(?:Issue|PR) #|(?:[a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100}#))\d{1,10}\]\(https://github\.com/([a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100})/"
-    match = re.search(link_pattern, content)
+    # Fast substring search first: notes without any GitHub link skip the regex scan
+    link_pos = content.find("](https://github.com/")
+    if link_pos == -1:
+        return config.default_repo
+
+    # Look for existing GitHub links to infer repo (handle both old and new formats).
+    # No link text is longer than _REPO_LINK_MAX_TEXT, so the regex can start there.
+    match = _REPO_LINK_RE.search(content, max(0, link_pos - _REPO_LINK_MAX_TEXT))
     if match:
         return match.group(1)
 
@@ -81,37 +149,34 @@ def get_date_range(period: str) -> str:
     """
     Convert period specification to date string for GitHub search queries.
 
-    Accepts specific dates in YYYY-MM-DD format or period keywords.
-    Currently only "today" is fully implemented, other periods default to today.
+    Accepts specific dates in YYYY-MM-DD format or period keywords. The
+    "this-week", "this-month" and "this-quarter" keywords become a
+    ``YYYY-MM-DD..YYYY-MM-DD`` range from the start of the period up to today,
+    so a single search covers the whole period. Unknown periods default to today.
 
     :param period: Date period specification ("today", "this-week", "YYYY-MM-DD", etc.)
-    :return: Date string in YYYY-MM-DD format
+    :return: Date string in YYYY-MM-DD format, or a date range for period keywords
     """
     if not period or not isinstance(period, str):
         return datetime.now().strftime("%Y-%m-%d")
 
-    today = datetime.now()
-
     # Check if period is a specific date (YYYY-MM-DD format)
-    try:
-        datetime.strptime(period, "%Y-%m-%d")
+    if _date_error(period) is None:
         return period  # Valid date format, use as-is
-    except ValueError:
-        pass  # Not a date, continue with period logic
-
-    if period == "today":
-        return today.strftime("%Y-%m-%d")
-    elif period == "this-week":
-        # TODO: Implement week range
-        return today.strftime("%Y-%m-%d")
+
+    today = datetime.now().date()
+
+    if period == "this-week":
+        start = today - timedelta(days=today.weekday())
     elif period == "this-month":
-        # TODO: Implement month range
-        return today.strftime("%Y-%m-%d")
+        start = today.replace(day=1)
     elif period == "this-quarter":
-        # TODO: Implement quarter range
-        return today.strftime("%Y-%m-%d")
+        start = today.replace(month=(today.month - 1) // 3 * 3 + 1, day=1)
     else:
-        return today.strftime("%Y-%m-%d")
+        # "today" and unknown periods
+        return today.isoformat()
+
+    return f"{start.isoformat()}..{today.isoformat()}"
 
 
 def get_default_daily_note(date: str | None = None) -> Path:
@@ -124,6 +189,162 @@ def get_default_daily_note(date: str | None = None) -> Path:
     return config.get_daily_note_path(date)
 
 
+def _scope_qualifiers(personal: bool = False) -> str:
+    """
+    Build the search scope covering all configured organizations.
+
+    Repeated ``org:``/``user:`` qualifiers are OR-ed by GitHub search, so one
+    query covers every organization instead of one query per organization.
+
+    :param personal: Also include the user's personal repositories (if user is not @me)
+    :return: Space-separated qualifiers, empty if there is nothing to search
+    """
+    qualifiers = [f"org:{org}" for org in config.github_orgs]
+    if personal and config.github_user != "@me":
+        qualifiers.append(f"user:{config.github_user}")
+    return " ".join(qualifiers)
+
+
+def _issues_created_queries(date_range: str) -> list[str]:
+    """
+    Build the search queries for issues authored by the user.
+
+    :param date_range: Date string for the GitHub search qualifier
+    :return: Search covering all organizations, plus personal repos if user is not @me
+    """
+    scope = _scope_qualifiers(personal=True)
+    if not scope:
+        return []
+    return [f"is:issue author:{config.github_user} {scope} created:{date_range}"]
+
+
+def _prs_created_queries(date_range: str) -> list[str]:
+    """
+    Build the search queries for PRs created by or assigned to the user.
+
+    :param date_range: Date string for the GitHub search qualifier
+    :return: Search covering all organizations
+    """
+    scope = _scope_qualifiers()
+    if not scope:
+        return []
+    return [
+        f"is:pr author:{config.github_user} assignee:{config.github_user} "
+        f"{scope} created:{date_range}"
+    ]
+
+
+def _issues_worked_on_queries(date_range: str) -> list[str]:
+    """
+    Build the search queries for issues the user was involved with.
+
+    :param date_range: Date string for the GitHub search qualifier
+    :return: Search covering all organizations
+    """
+    scope = _scope_qualifiers()
+    if not scope:
+        return []
+    return [f"is:issue involves:{config.github_user} {scope} updated:{date_range}"]
+
+
+def _issues_closed_queries(date_range: str) -> list[str]:
+    """
+    Build the search queries for closed issues created by or assigned to the user.
+
+    GitHub search cannot OR author and assignee, so there is one query for
+    each; the results are merged by URL.
+
+    :param date_range: Date string for the GitHub search qualifier
+    :return: Searches covering all organizations
+    """
+    scope = _scope_qualifiers()
+    if not scope:
+        return []
+    return [
+        f"is:issue {role}:{config.github_user} {scope} closed:{date_range}"
+        for role in ("author", "assignee")
+    ]
+
+
+def _prs_merged_queries(date_range: str) -> list[str]:
+    """
+    Build the search queries for merged PRs authored by or assigned to the user.
+
+    :param date_range: Date string for the GitHub search qualifier
+    :return: Search covering all organizations
+    """
+    scope = _scope_qualifiers()
+    if not scope:
+        return []
+    return [
+        f"is:pr author:{config.github_user} assignee:{config.github_user} "
+        f"{scope} merged:{date_range}"
+    ]
+
+
+# Results per search; the GraphQL API maximum, far above a day's activity
+_SEARCH_PAGE_SIZE = 100
+
+# Daily review categories mapped to their search query builder and GraphQL node fields
+_SEARCH_CATEGORIES = {
+    "issues_created": (_issues_created_queries, _ISSUE_NODE_FIELDS),
+    "prs_created": (_prs_created_queries, _PR_NODE_FIELDS),
+    "issues_worked_on": (_issues_worked_on_queries, _ISSUE_NODE_FIELDS),
+    "issues_closed": (_issues_closed_queries, _ISSUE_NODE_FIELDS),
+    "prs_merged": (_prs_merged_queries, _PR_NODE_FIELDS),
+}
+
+
+def _search_github(keys: Iterable[str], period: str) -> dict[str, list[dict[str, Any]]]:
+    """
+    Run the searches of several daily review categories in one GraphQL request.
+
+    Every category becomes an aliased ``search`` field of a single query, so
+    all categories cost one ``gh`` subprocess and one API round-trip.
+
+    :param keys: Category keys from _SEARCH_CATEGORIES
+    :param period: Time period to search ("today", "this-week", or YYYY-MM-DD)
+    :return: Dictionary mapping each requested key to its list of items
+    """
+    date_range = get_date_range(period)
+    queries = {key: _SEARCH_CATEGORIES[key][0](date_range) for key in keys}
+    results: dict[str, list[dict[str, Any]]] = {key: [] for key in queries}
+    # One aliased search per query, e.g. issues_closed_0 and issues_closed_1
+    searches = [
+        (f"{key}_{index}", key, query)
+        for key, key_queries in queries.items()
+        for index, query in enumerate(key_queries)
+    ]
+
+    if searches:
+        variables = ", ".join(f"${alias}: String!" for alias, _, _ in searches)
+        fields = " ".join(
+            f"{alias}: search(query: ${alias}, type: ISSUE, first: {_SEARCH_PAGE_SIZE}) "
+            f"{{ issueCount nodes {{ {_SEARCH_CATEGORIES[key][1]} }} }}"
+            for alias, key, _ in searches
+        )
+        cmd = ["gh", "api", "graphql", "-f", f"query=query({variables}) {{ {fields} }}"]
+        for alias, _, query in searches:
+            cmd += ["-f", f"{alias}={query}"]
+
+        data = run_gh_command(cmd, single=True).get("data") or {}
+        for alias, key, _ in searches:
+            search = data.get(alias) or {}
+            nodes = search.get("nodes", [])
+            if search.get("issueCount", 0) > len(nodes):
+                print(
+                    f"Warning: {key} shows only {len(nodes)} of {search['issueCount']} results",
+                    file=sys.stderr,
+                )
+            results[key].extend(node for node in nodes if node)
+
+    # Merge categories that needed several searches
+    for key, key_queries in queries.items():
+        if len(key_queries) > 1:
+            results[key] = deduplicate_github_items(results[key])
+    return results
+
+
 def fetch_issues_created(period: str = "today") -> list[dict[str, Any]]:
     """
     Retrieve GitHub issues created by the authenticated user in specified period.
@@ -134,23 +355,7 @@ def fetch_issues_created(period: str = "today") -> list[dict[str, Any]]:
     :param period: Time period to search ("today", "this-week", or YYYY-MM-DD)
     :return: List of issue dictionaries with number, title, url, and state
     """
-    date_range = get_date_range(period)
-    all_issues = []
-
-    for org in config.github_orgs:
-        search_query = f"author:{config.github_user} org:{org} created:{date_range}"
-        cmd = ["gh", "issue", "list", "--search", search_query, "--json", "number,title,url,state"]
-        issues = run_gh_command(cmd)
-        all_issues.extend(issues)
-
-    # Also check personal repos if user is not @me
-    if config.github_user != "@me":
-        search_query = f"author:{config.github_user} user:{config.github_user} created:{date_range}"
-        cmd = ["gh", "issue", "list", "--search", search_query, "--json", "number,title,url,state"]
-        issues = run_gh_command(cmd)
-        all_issues.extend(issues)
-
-    return all_issues
+    return _search_github(["issues_created"], period)["issues_created"]
 
 
 def fetch_prs_created(period: str = "today") -> list[dict[str, Any]]:
@@ -163,25 +368,7 @@ def fetch_prs_created(period: str = "today") -> list[dict[str, Any]]:
     :param period: Time period to search ("today", "this-week", or YYYY-MM-DD)
     :return: List of PR dictionaries with number, title, url, state, and timestamps
     """
-    date_range = get_date_range(period)
-    orgs = config.github_orgs
-    all_prs = []
-
-    for org in orgs:
-        search_query = f"author:{config.github_user} assignee:{config.github_user} org:{org} created:{date_range}"
-        cmd = [
-            "gh",
-            "pr",
-            "list",
-            "--search",
-            search_query,
-            "--json",
-            "number,title,url,state,createdAt,mergedAt",
-        ]
-        prs = run_gh_command(cmd)
-        all_prs.extend(prs)
-
-    return all_prs
+    return _search_github(["prs_created"], period)["prs_created"]
 
 
 def fetch_issues_worked_on(period: str = "today") -> list[dict[str, Any]]:
@@ -194,65 +381,20 @@ def fetch_issues_worked_on(period: str = "today") -> list[dict[str, Any]]:
     :param period: Time period to search ("today", "this-week", or YYYY-MM-DD)
     :return: List of issue dictionaries with number, title, url, and state
     """
-    date_range = get_date_range(period)
-    orgs = config.github_orgs
-    all_issues = []
-
-    for org in orgs:
-        search_query = f"involves:{config.github_user} org:{org} updated:{date_range}"
-        cmd = ["gh", "issue", "list", "--search", search_query, "--json", "number,title,url,state"]
-        issues = run_gh_command(cmd)
-        all_issues.extend(issues)
-
-    return all_issues
+    return _search_github(["issues_worked_on"], period)["issues_worked_on"]
 
 
 def fetch_issues_closed(period: str = "today") -> list[dict[str, Any]]:
     """
     Retrieve GitHub issues closed in specified period that were created by or assigned to user.
 
-    Searches for all closed issues in the period, then filters to only include
-    those authored by or assigned to the authenticated user.
+    Searches separately for closed issues authored by and assigned to the user,
+    so GitHub does the filtering, and merges both results by URL.
 
     :param period: Time period to search ("today", "this-week", or YYYY-MM-DD)
-    :return: List of issue dictionaries with number, title, url, state, assignees, and author
+    :return: List of issue dictionaries with number, title, url, and state
     """
-    date_range = get_date_range(period)
-    orgs = config.github_orgs
-    all_issues = []
-
-    for org in orgs:
-        search_query = f"org:{org} closed:{date_range}"
-        cmd = [
-            "gh",
-            "issue",
-            "list",
-            "--search",
-            search_query,
-            "--json",
-            "number,title,url,state,assignees,author",
-        ]
-        issues = run_gh_command(cmd)
-
-        # Filter for issues created by or assigned to user
-        filtered_issues = []
-        for issue in issues:
-            # For @me, use actual unix username
-            import getpass
-
-            username = getpass.getuser() if config.github_user == "@me" else config.github_user
-            is_author = issue.get("author", {}).get("login") == username
-            is_assignee = any(
-                assignee.get("login") == username for assignee in issue.get("assignees", [])
-            )
-            if is_author or is_assignee:
-                # Since these are from closed search, ensure state is marked as closed
-                issue["state"] = "closed"
-                filtered_issues.append(issue)
-
-        all_issues.extend(filtered_issues)
-
-    return all_issues
+    return _search_github(["issues_closed"], period)["issues_closed"]
 
 
 def fetch_prs_merged(period: str = "today") -> list[dict[str, Any]]:
@@ -265,25 +407,25 @@ def fetch_prs_merged(period: str = "today") -> list[dict[str, Any]]:
     :param period: Time period to search ("today", "this-week", or YYYY-MM-DD)
     :return: List of PR dictionaries with number, title, url, state, and timestamps
     """
-    date_range = get_date_range(period)
-    orgs = config.github_orgs
-    all_prs = []
+    return _search_github(["prs_merged"], period)["prs_merged"]
 
-    for org in orgs:
-        search_query = f"author:{config.github_user} assignee:{config.github_user} org:{org} merged:{date_range}"
-        cmd = [
-            "gh",
-            "pr",
-            "list",
-            "--search",
-            search_query,
-            "--json",
-            "number,title,url,state,createdAt,mergedAt",
-        ]
-        prs = run_gh_command(cmd)
-        all_prs.extend(prs)
 
-    return all_prs
+def fetch_all(period: str = "today") -> dict[str, list[dict[str, Any]]]:
+    """
+    Retrieve all GitHub activity for the daily review with a single request.
+
+    The searches of all five categories are sent as one GraphQL query, so the
+    whole daily review costs one ``gh`` subprocess and one API round-trip.
+
+    :param period: Time period to search ("today", "this-week", or YYYY-MM-DD)
+    :return: Dictionary with the same keys as expected by update_daily_review_section
+    """
+    return _search_github(_SEARCH_CATEGORIES, period)
+
+
+# Translation table for escape_markdown: special chars and backslashes are
+# prefixed with a single backslash
+_MD_ESCAPE = str.maketrans({char: f"\\{char}" for char in "*_`[]()#+-!|{}\\"})
 
 
 def escape_markdown(text: str) -> str:
@@ -296,11 +438,8 @@ def escape_markdown(text: str) -> str:
     if not isinstance(text, str):
         return str(text)
 
-    # Escape markdown special chars
-    special_chars = ["*", "_", "`", "[", "]", "(", ")", "#", "+", "-", "!", "|", "{", "}", "\\"]
-    for char in special_chars:
-        text = text.replace(char, f"\\{char}")
-    return text
+    # Escape markdown special chars in a single pass
+    return text.translate(_MD_ESCAPE)
 
 
 def extract_repo_from_url(url: str) -> str:
@@ -310,22 +449,11 @@ def extract_repo_from_url(url: str) -> str:
     :param url: GitHub URL (issue or PR)
     :return: Repository name in "owner/repo" format
     """
-    import re
-    from urllib.parse import urlparse
-
     if not isinstance(url, str):
         return "unknown/repo"
 
-    # Validate it's actually a GitHub URL
-    try:
-        parsed = urlparse(url)
-        if parsed.hostname not in ["github.com", "www.github.com"]:
-            return "unknown/repo"
-    except Exception:
-        return "unknown/repo"
-
-    # Use more specific, non-backtracking pattern to prevent ReDoS
-    match = re.search(r"github\.com/([a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100})", url)
+    # Validates the host and captures the repository in one anchored match
+    match = _REPO_URL_RE.match(url)
     return match.group(1) if match else "unknown/repo"
 
 
@@ -346,6 +474,22 @@ def format_issue_ref(issue: dict[str, Any]) -> str:
     return f"[{repo}#{issue['number']}]({issue['url']}) -- {title}"
 
 
+def _fmt_gh_ts(ts: str) -> str:
+    """
+    Format a GitHub ISO-8601 timestamp as "YYYY-MM-DD HH:MM".
+
+    GitHub returns fixed-width ``YYYY-MM-DDTHH:MM:SSZ`` timestamps, so the
+    common case is a slice instead of a full datetime parse and format.
+
+    :param ts: ISO-8601 timestamp string
+    :return: Timestamp formatted as "YYYY-MM-DD HH:MM"
+    """
+    if len(ts) < 16 or ts[10] != "T":
+        # fromisoformat() accepts the trailing "Z" natively since Python 3.11
+        return datetime.fromisoformat(ts).strftime("%Y-%m-%d %H:%M")
+    return ts[:16].replace("T", " ")
+
+
 def format_pr_ref(pr: dict[str, Any]) -> str:
     """
     Format GitHub pull request as markdown link with repository prefix, creation and merge timestamps.
@@ -357,23 +501,283 @@ def format_pr_ref(pr: dict[str, Any]) -> str:
     :return: Formatted markdown link string with repository prefix and timestamps
     """
     repo = extract_repo_from_url(pr["url"])
-    created_at = datetime.fromisoformat(pr["createdAt"].replace("Z", "+00:00"))
-    created_str = created_at.strftime("%Y-%m-%d %H:%M")
+    created_str = _fmt_gh_ts(pr["createdAt"])
 
     title = escape_markdown(pr.get("title", ""))
-    result = f"[{repo}#{pr['number']}]({pr['url']}) -- {title}"
 
     if pr.get("mergedAt"):
-        merged_at = datetime.fromisoformat(pr["mergedAt"].replace("Z", "+00:00"))
-        merged_str = merged_at.strftime("%Y-%m-%d %H:%M")
-        result += f" (opened {created_str}, merged {merged_str})"
+        merged_str = _fmt_gh_ts(pr["mergedAt"])
+        timestamps = f"opened {created_str}, merged {merged_str}"
+    else:
+        timestamps = f"opened {created_str}"
+
+    return f"[{repo}#{pr['number']}]({pr['url']}) -- {title} ({timestamps})"
+
+
+# Results of issue/PR lookups keyed on (ref_type, number, repo), shared by the formatters
+_gh_view_cache: dict[tuple[str, str, str], tuple[str, str | None, str | None] | None] = {}
+
+# Fields requested for every reference resolved via GraphQL
+_REF_GRAPHQL_FIELDS = "... on Issue { title url state } ... on PullRequest { title url state }"
+
+
+# Seconds a lookup cached on disk stays valid; closed issues and merged PRs rarely change
+_REF_CACHE_TTL_OPEN = 300
+_REF_CACHE_TTL_DONE = 30 * 24 * 3600
+
+# Repository names that are safe to use as cache directory names
+_CACHE_REPO_RE = re.compile(r"^[a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100}$")
+
+
+def _ref_cache_file(ref_type: str, number: str, repo: str) -> Path | None:
+    """
+    Locate the on-disk cache entry of an issue or PR lookup.
+
+    :param ref_type: "issue" or "pr"
+    :param number: Issue or PR number
+    :param repo: Repository name in "owner/repo" format
+    :return: Path of the cache file, or None if the reference cannot be cached safely
+    """
+    # Security: Only build paths from validated names to prevent path traversal
+    if not _CACHE_REPO_RE.match(repo) or not number.isdigit():
+        return None
+    return config.cache_dir / "refs" / repo / f"{ref_type}-{number}.json"
+
+
+def _load_cached_ref(key: tuple[str, str, str]) -> bool:
+    """
+    Seed the lookup cache from a fresh on-disk entry.
+
+    Open items expire after a few minutes, closed or merged ones after 30 days.
+
+    :param key: Tuple of (ref_type, number, repo)
+    :return: True if a fresh entry was found
+    """
+    path = _ref_cache_file(*key)
+    if path is None:
+        return False
+    try:
+        age = time.time() - path.stat().st_mtime
+        state, title, url = _json_loads(path.read_bytes())
+    except (OSError, ValueError, TypeError):
+        return False
+
+    ttl = _REF_CACHE_TTL_OPEN if str(state).lower() == "open" else _REF_CACHE_TTL_DONE
+    if age > ttl:
+        return False
+    _gh_view_cache[key] = (state, title, url)
+    return True
+
+
+def _store_cached_ref(key: tuple[str, str, str]) -> None:
+    """
+    Persist a successful lookup so later runs can skip the GitHub request.
+
+    :param key: Tuple of (ref_type, number, repo), already present in the lookup cache
+    """
+    value = _gh_view_cache.get(key)
+    path = _ref_cache_file(*key)
+    if value is None or path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(value), encoding="utf-8")
+    except OSError:
+        pass  # Caching is best effort
+
+
+def _gh_view(
+    ref_type: str, number: str, repo: str, use_cache: bool = True
+) -> tuple[str, str | None, str | None] | None:
+    """
+    Look up state, title and url of a GitHub issue or PR, once per process.
+
+    A daily note often references the same issue several times; caching the
+    lookup avoids spawning a ``gh`` subprocess for every occurrence. Successful
+    lookups are also cached on disk for later runs.
+
+    :param ref_type: "issue" or "pr"
+    :param number: Issue or PR number
+    :param repo: Repository name in "owner/repo" format
+    :param use_cache: If False, ignore the on-disk cache (fresh results are still stored)
+    :return: Tuple of (state, title, url), or None if the lookup failed
+    """
+    key = (ref_type, number, repo)
+    if key not in _gh_view_cache and not (use_cache and _load_cached_ref(key)):
+        gh_data = run_gh_command(
+            ["gh", ref_type, "view", number, "--repo", repo, "--json", _ISSUE_FIELDS],
+            single=True,
+        )
+        _gh_view_cache[key] = (
+            (gh_data.get("state", ""), gh_data.get("title"), gh_data.get("url"))
+            if gh_data
+            else None
+        )
+        _store_cached_ref(key)
+    return _gh_view_cache[key]
+
+
+def _prefetch_refs(refs: Iterable[tuple[str, str]], repo: str, use_cache: bool = True) -> None:
+    """
+    Resolve several issue/PR references with a single GraphQL query.
+
+    Seeds the lookup cache used by _gh_view so the formatters need one ``gh``
+    subprocess per note instead of one per reference. Every attempted reference
+    is cached, unresolved ones as None, so neither a later formatting pass nor
+    _gh_view queries GitHub for them again.
+
+    :param refs: Pairs of ("issue" or "pr", number)
+    :param repo: Repository name in "owner/repo" format
+    :param use_cache: If False, ignore the on-disk cache (fresh results are still stored)
+    """
+    missing = {(ref_type, number) for ref_type, number in refs}
+    missing = {
+        ref
+        for ref in missing
+        if (*ref, repo) not in _gh_view_cache and not (use_cache and _load_cached_ref((*ref, repo)))
+    }
+    # A single lookup gains nothing from batching
+    if len(missing) < 2 or repo.count("/") != 1:
+        return
+
+    owner, name = repo.split("/")
+    numbers = sorted({number for _, number in missing}, key=int)
+    aliases = " ".join(
+        f"n{number}: issueOrPullRequest(number: {int(number)}) {{ {_REF_GRAPHQL_FIELDS} }}"
+        for number in numbers
+    )
+    query = (
+        "query($owner: String!, $name: String!) "
+        f"{{ repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+    )
+    response = run_gh_command(
+        [
+            "gh",
+            "api",
+            "graphql",
+            "-f",
+            f"query={query}",
+            "-f",
+            f"owner={owner}",
+            "-f",
+            f"name={name}",
+        ],
+        single=True,
+    )
+    repository = (response.get("data") or {}).get("repository") or {}
+
+    for ref_type, number in missing:
+        node = repository.get(f"n{number}")
+        _gh_view_cache[(ref_type, number, repo)] = (
+            (node.get("state", ""), node.get("title"), node.get("url")) if node else None
+        )
+        _store_cached_ref((ref_type, number, repo))
+
+
+def _replace_issue_link(
+    original: str,
+    number: str,
+    url: str,
+    title: str,
+    repo: str,
+    dry_run: bool,
+    use_cache: bool = True,
+) -> str:
+    """
+    Rewrite a formatted issue link in the new format, adding ✅ if the issue is closed.
+
+    :param original: Matched link text, returned unchanged on dry run or lookup error
+    :param number: Issue number
+    :param url: Issue URL
+    :param title: Title text following the link
+    :param repo: Repository name in "owner/repo" format used for the lookup
+    :param dry_run: If True, only print what would be changed
+    :param use_cache: If False, ignore the on-disk lookup cache
+    :return: Replacement text for the link
+    """
+    if dry_run:
+        # Extract repo name from URL for display
+        repo_name = extract_repo_from_url(url)
+        print(f"Would check if {repo_name}#{number} is closed and add ✅ if needed")
+        return original
+
+    # Get issue state from GitHub
+    gh_data = _gh_view("issue", number, repo, use_cache)
+
+    if gh_data and gh_data[0].lower() == "closed":
+        # Use new format with repo prefix
+        repo_name = extract_repo_from_url(url)
+        return f"[{repo_name}#{number}]({url}) -- ✅ {title}"
+    elif gh_data:
+        # Issue is open, use new format without checkmark
+        repo_name = extract_repo_from_url(url)
+        return f"[{repo_name}#{number}]({url}) -- {title}"
+    else:
+        return original  # No change if error
+
+
+def _replace_unformatted_ref(
+    original: str, ref_type: str, number: str, repo: str, dry_run: bool, use_cache: bool = True
+) -> str:
+    """
+    Turn a plain "Issue #123" or "PR #456" reference into a markdown link with title.
+
+    :param original: Matched reference text, returned unchanged on dry run or lookup error
+    :param ref_type: "Issue" or "PR"
+    :param number: Issue or PR number
+    :param repo: Repository name in "owner/repo" format
+    :param dry_run: If True, only print what would be changed
+    :param use_cache: If False, ignore the on-disk lookup cache
+    :return: Replacement text for the reference
+    """
+    if dry_run:
+        print(
+            f"Would format: {original} -> [{ref_type} #{number}](https://github.com/{repo}/{'issues' if ref_type == 'Issue' else 'pull'}/{number}) -- <title>"
+        )
+        return original
+
+    # Get title and state from GitHub
+    gh_data = _gh_view(ref_type.lower(), number, repo, use_cache)
+
+    if gh_data and gh_data[1] is not None:
+        state, title, url = gh_data
+        title = escape_markdown(title)
+        repo_name = extract_repo_from_url(url)
+
+        # Add checkmark if it's a closed issue
+        if ref_type == "Issue" and state.lower() == "closed":
+            title = f"✅ {title}"
+
+        return f"[{repo_name}#{number}]({url}) -- {title}"
     else:
-        result += f" (opened {created_str})"
+        print(f"Warning: Could not fetch data for {ref_type} #{number}", file=sys.stderr)
+        return original
 
-    return result
 
+def _splice_matches(
+    content: str, matches: list[re.Match[str]], replace: Callable[[re.Match[str]], str]
+) -> str:
+    """
+    Substitute already found matches, like ``re.sub`` but without scanning content again.
+
+    :param content: Text the matches were found in
+    :param matches: Non-overlapping matches in order, as returned by ``finditer``
+    :param replace: Function returning the replacement text for a match
+    :return: Content with every match replaced
+    """
+    parts = []
+    last_end = 0
+    for match in matches:
+        parts.append(content[last_end : match.start()])
+        parts.append(replace(match))
+        last_end = match.end()
+    parts.append(content[last_end:])
+    return "".join(parts)
 
-def add_checkmarks_to_closed_issues(content: str, repo: str, dry_run: bool = False) -> str:
+
+def add_checkmarks_to_closed_issues(
+    content: str, repo: str, dry_run: bool = False, use_cache: bool = True
+) -> str:
     """
     Update existing GitHub issue links in markdown content to add checkmarks for closed issues.
 
@@ -383,45 +787,28 @@ def add_checkmarks_to_closed_issues(content: str, repo: str, dry_run: bool = Fal
     :param content: Markdown content containing GitHub issue links
     :param repo: Repository name in "owner/repo" format
     :param dry_run: If True, only print what would be changed without modifying content
+    :param use_cache: If False, ignore cached lookups from earlier runs
     :return: Updated markdown content with checkmarks added to closed issues
     """
-    # Pattern to find existing GitHub issue links without checkmarks
-    # Updated to handle both old format (Issue #123) and new format (owner/repo#123)
-    # Use specific patterns to prevent ReDoS vulnerabilities
-    issue_pattern = r"\[(?:Issue #|(?:[a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100}#))(\d{1,10})\]\((https://github\.com/[a-zA-Z0-9_-]{1,100}/[a-zA-Z0-9_-]{1,100}/issues/\d{1,10})\) -- (?!✅)(.{1,500})"
-
-    def update_issue_ref(match):
-        number = match.group(1)
-        url = match.group(2)
-        title = match.group(3)
-
-        if dry_run:
-            # Extract repo name from URL for display
-            repo_name = extract_repo_from_url(url)
-            print(f"Would check if {repo_name}#{number} is closed and add ✅ if needed")
-            return match.group(0)
+    matches = list(_ISSUE_LINK_RE.finditer(content))
+    if not matches:
+        return content
 
-        # Get issue state from GitHub
-        gh_data = run_gh_command(
-            ["gh", "issue", "view", number, "--repo", repo, "--json", "number,title,url,state"],
-            single=True,
-        )
-
-        if gh_data and gh_data.get("state", "").lower() == "closed":
-            # Use new format with repo prefix
-            repo_name = extract_repo_from_url(url)
-            return f"[{repo_name}#{number}]({url}) -- ✅ {title}"
-        elif gh_data:
-            # Issue is open, use new format without checkmark
-            repo_name = extract_repo_from_url(url)
-            return f"[{repo_name}#{number}]({url}) -- {title}"
-        else:
-            return match.group(0)  # No change if error
+    if not dry_run:
+        _prefetch_refs((("issue", m.group(1)) for m in matches), repo, use_cache)
 
-    return re.sub(issue_pattern, update_issue_ref, content)
+    return _splice_matches(
+        content,
+        matches,
+        lambda m: _replace_issue_link(
+            m.group(0), m.group(1), m.group(2), m.group(3), repo, dry_run, use_cache
+        ),
+    )
 
 
-def format_unformatted_github_refs(content: str, repo: str, dry_run: bool = False) -> str:
+def format_unformatted_github_refs(
+    content: str, repo: str, dry_run: bool = False, use_cache: bool = True
+) -> str:
     """
     Convert plain GitHub references to formatted markdown links with titles.
 
@@ -431,56 +818,28 @@ def format_unformatted_github_refs(content: str, repo: str, dry_run: bool = Fals
     :param content: Markdown content containing unformatted GitHub references
     :param repo: Repository name in "owner/repo" format
     :param dry_run: If True, only print what would be changed without modifying content
+    :param use_cache: If False, ignore cached lookups from earlier runs
     :return: Updated markdown content with formatted GitHub links
     """
-    # Pattern to find unformatted references (not already in markdown links)
-    # Use negative lookbehind to avoid matching inside existing links
-    # Limit number length to prevent ReDoS
-    pattern = r"(?<!\[)(?:Issue|PR) #(\d{1,10})(?!\]\()(?![^\[]*\]\()"
-
-    def replace_ref(match):
-        ref_type = "Issue" if match.group(0).startswith("Issue") else "PR"
-        number = match.group(1)
-
-        if dry_run:
-            print(
-                f"Would format: {match.group(0)} -> [{ref_type} #{number}](https://github.com/{repo}/{'issues' if ref_type == 'Issue' else 'pull'}/{number}) -- <title>"
-            )
-            return match.group(0)
-
-        # Get title and state from GitHub
-        gh_data = run_gh_command(
-            [
-                "gh",
-                ref_type.lower(),
-                "view",
-                number,
-                "--repo",
-                repo,
-                "--json",
-                "number,title,url,state",
-            ],
-            single=True,
-        )
-
-        if gh_data and "title" in gh_data:
-            title = escape_markdown(gh_data["title"])
-            url = gh_data["url"]
-            repo_name = extract_repo_from_url(url)
-
-            # Add checkmark if it's a closed issue
-            if ref_type == "Issue" and gh_data.get("state", "").lower() == "closed":
-                title = f"✅ {title}"
+    matches = list(_UNFORMATTED_REF_RE.finditer(content))
+    if not matches:
+        return content
 
-            return f"[{repo_name}#{number}]({url}) -- {title}"
-        else:
-            print(f"Warning: Could not fetch data for {ref_type} #{number}", file=sys.stderr)
-            return match.group(0)
+    if not dry_run:
+        _prefetch_refs(((m.group(1).lower(), m.group(2)) for m in matches), repo, use_cache)
 
-    return re.sub(pattern, replace_ref, content)
+    return _splice_matches(
+        content,
+        matches,
+        lambda m: _replace_unformatted_ref(
+            m.group(0), m.group(1), m.group(2), repo, dry_run, use_cache
+        ),
+    )
 
 
-def format_all_github_refs(content: str, repo: str | None = None, dry_run: bool = False) -> str:
+def format_all_github_refs(
+    content: str, repo: str | None = None, dry_run: bool = False, use_cache: bool = True
+) -> str:
     """
     Comprehensively format all GitHub references in markdown content.
 
@@ -488,21 +847,51 @@ def format_all_github_refs(content: str, repo: str | None = None, dry_run: bool
     1. Adds checkmarks to existing formatted issue links that are closed
     2. Converts unformatted references to proper markdown links
 
+    The passes run in this order because the title following an issue link may
+    itself contain plain references. All references of both passes are collected
+    in one scan and resolved up front with one batched lookup.
+
     :param content: Markdown content to process
     :param repo: Repository name in "owner/repo" format, auto-detected if None
     :param dry_run: If True, only print what would be changed without modifying content
+    :param use_cache: If False, ignore cached lookups from earlier runs
     :return: Updated markdown content with all GitHub references properly formatted
     """
+    matches = list(_ALL_REFS_RE.finditer(content))
+    if not matches:
+        return content
+
     if repo is None:
         repo = detect_repo_from_content(content)
 
-    # First, add checkmarks to existing formatted issue links that are closed
-    content = add_checkmarks_to_closed_issues(content, repo, dry_run)
+    link_matches = [m for m in matches if m.group(1) is not None]
+
+    if not dry_run:
+        refs = []
+        for match in matches:
+            number, _, title, ref_type, ref_number = match.groups()
+            if number is None:
+                refs.append((ref_type.lower(), ref_number))
+                continue
+            refs.append(("issue", number))
+            # The link title may hold plain references, formatted by the second pass
+            refs.extend(
+                (m.group(1).lower(), m.group(2)) for m in _UNFORMATTED_REF_RE.finditer(title)
+            )
+        _prefetch_refs(refs, repo, use_cache)
 
-    # Then, format unformatted references
-    content = format_unformatted_github_refs(content, repo, dry_run)
+    # First, add checkmarks to existing formatted issue links that are closed
+    content = _splice_matches(
+        content,
+        link_matches,
+        lambda m: _replace_issue_link(
+            m.group(0), m.group(1), m.group(2), m.group(3), repo, dry_run, use_cache
+        ),
+    )
 
-    return content
+    # Then, format unformatted references; this rescans the rewritten note
+    # and is served from the prefetched lookups
+    return format_unformatted_github_refs(content, repo, dry_run, use_cache)
 
 
 def deduplicate_github_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -512,22 +901,43 @@ def deduplicate_github_items(items: list[dict[str, Any]]) -> list[dict[str, Any]
     :param items: List of GitHub items (issues or PRs)
     :return: Deduplicated and sorted list of items
     """
-    # Deduplicate by URL
+    # Deduplicate by URL, computing the (repository, number) sort key in the same pass
     seen_urls = set()
-    unique_items = []
+    keyed_items = []
     for item in items:
         url = item.get("url", "")
         if url and url not in seen_urls:
             seen_urls.add(url)
-            unique_items.append(item)
+            keyed_items.append(((extract_repo_from_url(url), item.get("number", 0)), item))
 
     # Sort by repository name and then by number
-    def sort_key(item):
-        repo = extract_repo_from_url(item.get("url", ""))
-        number = item.get("number", 0)
-        return (repo, number)
+    keyed_items.sort(key=itemgetter(0))
+    return [item for _, item in keyed_items]
 
-    return sorted(unique_items, key=sort_key)
+
+def _format_worked_on_ref(issue: dict[str, Any]) -> str:
+    """
+    Format an issue worked on, followed by its current state.
+
+    :param issue: Issue dictionary containing number, title, url, and state
+    :return: Formatted markdown link string with the state in parentheses
+    """
+    return f"{format_issue_ref(issue)} ({issue['state']})"
+
+
+def _review_section(
+    header: str, items: list[dict[str, Any]], formatter: Callable[[dict[str, Any]], str]
+) -> str:
+    """
+    Render one Daily Review section as a header followed by one line per item.
+
+    :param header: Section header line
+    :param items: Deduplicated and sorted GitHub items
+    :param formatter: Function formatting a single item as markdown
+    :return: Section text, with "NONE" if there are no items
+    """
+    body = "".join(f"- {formatter(item)}\n" for item in items) or "NONE\n"
+    return f"{header}\n{body}"
 
 
 def update_daily_review_section(content: str, github_data: dict[str, list]) -> str:
@@ -543,66 +953,25 @@ def update_daily_review_section(content: str, github_data: dict[str, list]) -> s
     :return: Updated markdown content with Daily Review section
     """
 
-    # Deduplicate and sort all GitHub data
-    deduplicated_data = {
-        "issues_created": deduplicate_github_items(github_data.get("issues_created", [])),
-        "prs_created": deduplicate_github_items(github_data.get("prs_created", [])),
-        "issues_closed": deduplicate_github_items(github_data.get("issues_closed", [])),
-        "issues_worked_on": deduplicate_github_items(github_data.get("issues_worked_on", [])),
-        "prs_merged": deduplicate_github_items(github_data.get("prs_merged", [])),
-    }
-
-    # Format the new Daily Review content
-    review_content = "## Daily Review\n\n"
-
-    # Issues created today
-    review_content += f"{SECTION_ISSUES_CREATED}\n"
-    if deduplicated_data["issues_created"]:
-        for issue in deduplicated_data["issues_created"]:
-            review_content += f"- {format_issue_ref(issue)}\n"
-    else:
-        review_content += "NONE\n"
-    review_content += "\n"
-
-    # PRs created today
-    review_content += f"{SECTION_PRS_CREATED}\n"
-    if deduplicated_data["prs_created"]:
-        for pr in deduplicated_data["prs_created"]:
-            review_content += f"- {format_pr_ref(pr)}\n"
-    else:
-        review_content += "NONE\n"
-    review_content += "\n"
-
-    # Issues closed today
-    review_content += f"{SECTION_ISSUES_CLOSED}\n"
-    if deduplicated_data["issues_closed"]:
-        for issue in deduplicated_data["issues_closed"]:
-            review_content += f"- {format_issue_ref(issue)}\n"
-    else:
-        review_content += "NONE\n"
-    review_content += "\n"
-
-    # Issues worked on today
-    review_content += f"{SECTION_ISSUES_WORKED}\n"
-    if deduplicated_data["issues_worked_on"]:
-        for issue in deduplicated_data["issues_worked_on"]:
-            review_content += f"- {format_issue_ref(issue)} ({issue['state']})\n"
-    else:
-        review_content += "NONE\n"
-    review_content += "\n"
-
-    # PRs merged today
-    review_content += f"{SECTION_PRS_MERGED}\n"
-    if deduplicated_data["prs_merged"]:
-        for pr in deduplicated_data["prs_merged"]:
-            review_content += f"- {format_pr_ref(pr)}\n"
-    else:
-        review_content += "NONE\n"
-
-    # Replace the Daily Review section
-    pattern = r"(## Daily Review\n\n)(.*?)(?=\n###|\n## |$)"
-    if re.search(pattern, content, re.DOTALL):
-        return re.sub(pattern, review_content, content, flags=re.DOTALL)
-    else:
-        # If section doesn't exist, append it
-        return content + "\n\n" + review_content
+    # One entry per section in display order: header, data key and line formatter
+    sections = (
+        (SECTION_ISSUES_CREATED, "issues_created", format_issue_ref),
+        (SECTION_PRS_CREATED, "prs_created", format_pr_ref),
+        (SECTION_ISSUES_CLOSED, "issues_closed", format_issue_ref),
+        (SECTION_ISSUES_WORKED, "issues_worked_on", _format_worked_on_ref),
+        (SECTION_PRS_MERGED, "prs_merged", format_pr_ref),
+    )
+
+    # Deduplicate and sort the items of every section, then format the new Daily Review content
+    review_content = "## Daily Review\n\n" + "\n".join(
+        _review_section(header, deduplicate_github_items(github_data.get(key, [])), formatter)
+        for header, key, formatter in sections
+    )
+
+    # Replace the Daily Review section in a single pass; the callable inserts
+    # review_content literally instead of parsing it as a replacement template
+    new_content, replaced = _DAILY_REVIEW_RE.subn(lambda _: review_content, content)
+    if replaced:
+        return new_content
+    # If section doesn't exist, append it
+    return content + "\n\n" + review_content
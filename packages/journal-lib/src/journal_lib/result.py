@@ -19,18 +19,26 @@ Example usage:
         print(f"Got: {result.value}")
     else:
         print(f"Error: {result.error}")
+
+Results can also be matched structurally:
+    match some_operation():
+        case Success(value):
+            print(f"Got: {value}")
+        case Failure(error):
+            print(f"Error: {error}")
 """
 
+from dataclasses import dataclass
 from typing import TypeVar
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True, slots=True)
 class Success[T]:
     """Represents a successful operation with a value."""
 
-    def __init__(self, value: T):
-        self.value = value
+    value: T
 
     def is_success(self) -> bool:
         return True
@@ -39,11 +47,11 @@ class Success[T]:
         return False
 
 
+@dataclass(frozen=True, slots=True)
 class Failure:
     """Represents a failed operation with an error message."""
 
-    def __init__(self, error: str):
-        self.error = error
+    error: str
 
     def is_success(self) -> bool:
         return False
@@ -0,0 +1,73 @@
+"""Tests for journal_lib.config module."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import journal_lib.config
+from journal_lib.config import JournalConfig
+
+
+class TestDefaultRepo:
+    """Test lazy default repository resolution."""
+
+    def test_default_repo_not_detected_on_construction(self):
+        """Test that creating a config does not run git detection."""
+        with patch.object(JournalConfig, '_detect_default_repo') as mock_detect:
+            JournalConfig()
+            mock_detect.assert_not_called()
+
+    def test_default_repo_from_environment(self, monkeypatch):
+        """Test that JOURNAL_DEFAULT_REPO takes precedence over git detection."""
+        monkeypatch.setenv("JOURNAL_DEFAULT_REPO", "owner/repo")
+        with patch.object(JournalConfig, '_detect_default_repo') as mock_detect:
+            assert JournalConfig().default_repo == "owner/repo"
+            mock_detect.assert_not_called()
+
+    def test_default_repo_detected_once(self, monkeypatch):
+        """Test that git detection runs on first access only."""
+        monkeypatch.delenv("JOURNAL_DEFAULT_REPO", raising=False)
+        with patch.object(JournalConfig, '_detect_default_repo', return_value="git/repo") as mock_detect:
+            cfg = JournalConfig()
+            assert cfg.default_repo == "git/repo"
+            assert cfg.default_repo == "git/repo"
+            mock_detect.assert_called_once()
+
+    def test_import_does_not_run_git(self):
+        """Test that importing the module creates the global config without git."""
+        # Import in a fresh interpreter so this process keeps its single config module
+        code = (
+            "from unittest.mock import patch\n"
+            "with patch('subprocess.run') as mock_run:\n"
+            "    import journal_lib.config\n"
+            "mock_run.assert_not_called()\n"
+        )
+        src_dir = Path(journal_lib.config.__file__).parents[1]
+        pythonpath = [str(src_dir), os.environ.get("PYTHONPATH", "")]
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, pythonpath))}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        assert result.returncode == 0, result.stderr
+
+
+class TestDailyNotePath:
+    """Test daily note path validation."""
+
+    def test_valid_date(self):
+        """Test that a valid date maps to the daily note file."""
+        cfg = JournalConfig(notes_dir=Path("/notes"))
+        assert cfg.get_daily_note_path("2024-01-31") == Path("/notes/daily/2024-01-31.md")
+
+    @pytest.mark.parametrize("date", ["20240131", "2024-W05-3", "../../etc", "2024-01-31T00", "2024-01-3x"])
+    def test_invalid_format(self, date):
+        """Test that non YYYY-MM-DD strings are rejected before parsing."""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            JournalConfig().get_daily_note_path(date)
+
+    def test_invalid_value(self):
+        """Test that well-formed but impossible dates are rejected."""
+        with pytest.raises(ValueError, match="Invalid date value"):
+            JournalConfig().get_daily_note_path("2024-02-30")
@@ -1,10 +1,10 @@
 """Tests for journal_lib.github module."""
 
-import getpass
 import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import Mock, patch, mock_open
 
 import pytest
@@ -12,6 +12,15 @@ import pytest
 from journal_lib import github
 
 
+@pytest.fixture(autouse=True)
+def _clear_gh_view_cache(tmp_path, monkeypatch):
+    """Isolate tests from the per-process and on-disk GitHub lookup caches."""
+    monkeypatch.setattr(github.config, "cache_dir", tmp_path / "cache")
+    github._gh_view_cache.clear()
+    yield
+    github._gh_view_cache.clear()
+
+
 class TestGitHubCommands:
     """Test GitHub CLI command execution functions."""
 
@@ -26,7 +35,7 @@ class TestGitHubCommands:
             
             assert result == [{"number": 1, "title": "Test"}]
             mock_run.assert_called_once_with(
-                ['gh', 'issue', 'list'], capture_output=True, text=True, check=True
+                ['gh', 'issue', 'list'], capture_output=True, check=True
             )
 
     def test_run_gh_command_empty_output(self):
@@ -48,6 +57,36 @@ class TestGitHubCommands:
                 assert result == []
                 mock_print.assert_called_once()
 
+    def test_run_gh_command_bytes_output(self):
+        """Test gh command output is decoded from raw bytes."""
+        mock_result = Mock()
+        mock_result.stdout = '[{"number": 1, "title": "Tëst"}]'.encode()
+        mock_result.returncode = 0
+        
+        with patch('subprocess.run', return_value=mock_result):
+            result = github.run_gh_command(['gh', 'issue', 'list'])
+            assert result == [{"number": 1, "title": "Tëst"}]
+
+    def test_run_gh_command_subprocess_error_bytes_stderr(self):
+        """Test gh command error message decodes stderr bytes."""
+        error = subprocess.CalledProcessError(1, 'gh', stderr=b'auth required')
+        with patch('subprocess.run', side_effect=error):
+            with patch('builtins.print') as mock_print:
+                result = github.run_gh_command(['gh', 'issue', 'list'])
+                
+                assert result == []
+                assert "auth required" in mock_print.call_args[0][0]
+
+    def test_run_gh_command_graphql_partial_errors(self):
+        """Test gh api graphql data is kept when the command fails on some of the query."""
+        stdout = b'{"data": {"repository": {"n1": null}}, "errors": [{"message": "Could not resolve"}]}'
+        error = subprocess.CalledProcessError(1, 'gh', output=stdout, stderr=b'Could not resolve')
+        with patch('subprocess.run', side_effect=error):
+            with patch('builtins.print'):
+                result = github.run_gh_command(['gh', 'api', 'graphql', '-f', 'query={}'], single=True)
+        
+        assert result == {"data": {"repository": {"n1": None}}, "errors": [{"message": "Could not resolve"}]}
+
     def test_run_gh_command_json_decode_error(self):
         """Test gh command execution with invalid JSON."""
         mock_result = Mock()
@@ -81,6 +120,27 @@ class TestGitHubCommands:
             result = github.run_gh_command(['gh', 'issue', 'view', '1'], single=True)
             assert result == {}
 
+    def test_run_gh_command_api_graphql_allowed(self):
+        """Test gh api is accepted for GraphQL queries."""
+        mock_result = Mock()
+        mock_result.stdout = b'{"data": {}}'
+        
+        with patch('subprocess.run', return_value=mock_result) as mock_run:
+            result = github.run_gh_command(['gh', 'api', 'graphql', '-f', 'query={}'], single=True)
+            assert result == {"data": {}}
+            mock_run.assert_called_once()
+
+    @pytest.mark.parametrize("cmd", [
+        ['gh', 'api', 'repos/owner/repo/issues/1', '-X', 'DELETE'],
+        ['gh', 'api'],
+    ])
+    def test_run_gh_command_api_rest_rejected(self, cmd):
+        """Test gh api is rejected for anything but GraphQL queries."""
+        with patch('subprocess.run') as mock_run:
+            with pytest.raises(ValueError, match="Unsupported gh api endpoint"):
+                github.run_gh_command(cmd)
+            mock_run.assert_not_called()
+
 
 class TestRepositoryDetection:
     """Test repository detection from content."""
@@ -124,33 +184,53 @@ class TestRepositoryDetection:
         assert result == config.default_repo
 
 
+class FrozenDatetime(datetime):
+    """datetime whose now() is fixed to Thursday, 2024-05-16 09:30."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 5, 16, 9, 30)
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Freeze the current time seen by the github and config modules."""
+    monkeypatch.setattr('journal_lib.github.datetime', FrozenDatetime)
+    monkeypatch.setattr('journal_lib.config.datetime', FrozenDatetime)
+
+
+@pytest.mark.usefixtures("frozen_time")
 class TestDateRangeHandling:
     """Test date range conversion for GitHub searches."""
 
     def test_get_date_range_today(self):
         """Test date range for 'today' period returns current date."""
-        result = github.get_date_range("today")
-        # Should return a valid date string in YYYY-MM-DD format
-        datetime.strptime(result, "%Y-%m-%d")  # Will raise if invalid format
+        assert github.get_date_range("today") == "2024-05-16"
 
     def test_get_date_range_specific_date(self):
         """Test date range with specific date."""
         result = github.get_date_range("2023-12-15")
         assert result == "2023-12-15"
 
-    def test_get_date_range_this_week(self):
-        """Test date range for 'this-week' period (currently defaults to today)."""
-        result = github.get_date_range("this-week")
-        # Should return a valid date string in YYYY-MM-DD format  
-        datetime.strptime(result, "%Y-%m-%d")  # Will raise if invalid format
+    @pytest.mark.parametrize("period,expected", [
+        ("this-week", "2024-05-13..2024-05-16"),
+        ("this-month", "2024-05-01..2024-05-16"),
+        ("this-quarter", "2024-04-01..2024-05-16"),
+    ])
+    def test_get_date_range_periods(self, period, expected):
+        """Test period keywords become a range from the period start up to today."""
+        assert github.get_date_range(period) == expected
 
     def test_get_date_range_invalid_date(self):
         """Test date range with invalid date format defaults to today."""
-        result = github.get_date_range("invalid-date-format")
-        # Should return a valid date string in YYYY-MM-DD format (today's date)
-        datetime.strptime(result, "%Y-%m-%d")  # Will raise if invalid format
+        assert github.get_date_range("invalid-date-format") == "2024-05-16"
 
+    def test_get_date_range_invalid_calendar_date(self):
+        """Test date range with well-formed but impossible date defaults to today."""
+        assert github.get_date_range("2023-13-45") == "2024-05-16"
 
+
+@pytest.mark.usefixtures("frozen_time")
 class TestDailyNoteHandling:
     """Test daily note file path generation."""
 
@@ -165,9 +245,7 @@ class TestDailyNoteHandling:
         """Test daily note path without date (uses today)."""
         from journal_lib.config import config
         result = github.get_default_daily_note()
-        # Should return path with today's date
-        today = datetime.now().strftime("%Y-%m-%d")
-        expected = config.notes_dir / "daily" / f"{today}.md"
+        expected = config.notes_dir / "daily" / "2024-05-16.md"
         assert result == expected
 
 
@@ -179,83 +257,131 @@ class TestGitHubDataFetching:
     def test_fetch_issues_created(self, mock_get_date, mock_run_gh):
         """Test fetching created issues."""
         mock_get_date.return_value = "2023-12-01"
-        mock_run_gh.return_value = [{"number": 1, "title": "Test Issue"}]
+        mock_run_gh.return_value = {
+            "data": {"issues_created_0": {"nodes": [{"number": 1, "title": "Test Issue"}]}}
+        }
         
         result = github.fetch_issues_created("today")
         
-        # Should be called 2 times (2 orgs, personal repo only if user != @me)
-        assert mock_run_gh.call_count == 2
-        assert len(result) == 2  # Each call returns 1 item
+        # One GraphQL search covers all orgs (and personal repos if user != @me)
+        assert mock_run_gh.call_count == 1
+        assert result == [{"number": 1, "title": "Test Issue"}]
+        cmd = mock_run_gh.call_args[0][0]
+        assert cmd[:3] == ["gh", "api", "graphql"]
+        query = next(arg for arg in cmd if arg.startswith("issues_created_0="))
+        assert "is:issue" in query
+        assert "org:digitalgedacht" in query and "org:nexiles" in query
+        assert "created:2023-12-01" in query
 
     @patch('journal_lib.github.run_gh_command')
     @patch('journal_lib.github.get_date_range')
     def test_fetch_prs_created(self, mock_get_date, mock_run_gh):
         """Test fetching created PRs."""
         mock_get_date.return_value = "2023-12-01"
-        mock_run_gh.return_value = [{"number": 1, "title": "Test PR"}]
+        mock_run_gh.return_value = {
+            "data": {"prs_created_0": {"nodes": [{"number": 1, "title": "Test PR"}]}}
+        }
         
         result = github.fetch_prs_created("today")
         
-        # Should be called 2 times (2 orgs)
-        assert mock_run_gh.call_count == 2
-        assert len(result) == 2
+        assert mock_run_gh.call_count == 1
+        assert len(result) == 1
 
     @patch('journal_lib.github.run_gh_command')
     @patch('journal_lib.github.get_date_range')
     def test_fetch_issues_worked_on(self, mock_get_date, mock_run_gh):
         """Test fetching issues worked on."""
         mock_get_date.return_value = "2023-12-01"
-        mock_run_gh.return_value = [{"number": 1, "title": "Test Issue"}]
+        mock_run_gh.return_value = {
+            "data": {"issues_worked_on_0": {"nodes": [{"number": 1, "title": "Test Issue"}]}}
+        }
         
         result = github.fetch_issues_worked_on("today")
         
-        assert mock_run_gh.call_count == 2  # 2 orgs
-        assert len(result) == 2
+        assert mock_run_gh.call_count == 1
+        assert len(result) == 1
 
     @patch('journal_lib.github.run_gh_command')
     @patch('journal_lib.github.get_date_range')
     def test_fetch_issues_closed(self, mock_get_date, mock_run_gh):
-        """Test fetching closed issues with filtering."""
+        """Test fetching closed issues authored by or assigned to the user."""
         mock_get_date.return_value = "2023-12-01"
-        mock_run_gh.return_value = [
-            {
-                "number": 1, 
-                "title": "Test Issue",
-                "author": {"login": getpass.getuser()},
-                "assignees": []
-            },
-            {
-                "number": 2,
-                "title": "Other Issue", 
-                "author": {"login": "other"},
-                "assignees": [{"login": getpass.getuser()}]
-            },
-            {
-                "number": 3,
-                "title": "Unrelated Issue",
-                "author": {"login": "other"},
-                "assignees": []
+        authored = {"number": 1, "title": "Test Issue", "url": "https://github.com/o/r/issues/1"}
+        assigned = {"number": 2, "title": "Other Issue", "url": "https://github.com/o/r/issues/2"}
+        mock_run_gh.return_value = {
+            "data": {
+                "issues_closed_0": {"nodes": [authored, assigned]},
+                "issues_closed_1": {"nodes": [assigned]}
             }
-        ]
+        }
         
         result = github.fetch_issues_closed("today")
         
-        # Should filter to only issues by or assigned to user
-        assert len(result) == 4  # 2 orgs * 2 filtered issues
-        for issue in result:
-            assert issue["state"] == "closed"
+        # GitHub filters by author and assignee, results are merged by URL
+        assert [issue["number"] for issue in result] == [1, 2]
+        mock_run_gh.assert_called_once()
+        cmd = mock_run_gh.call_args[0][0]
+        assert any(arg.startswith("issues_closed_0=is:issue author:") for arg in cmd)
+        assert any(arg.startswith("issues_closed_1=is:issue assignee:") for arg in cmd)
 
     @patch('journal_lib.github.run_gh_command')
     @patch('journal_lib.github.get_date_range')  
     def test_fetch_prs_merged(self, mock_get_date, mock_run_gh):
         """Test fetching merged PRs."""
         mock_get_date.return_value = "2023-12-01"
-        mock_run_gh.return_value = [{"number": 1, "title": "Test PR"}]
+        mock_run_gh.return_value = {
+            "data": {"prs_merged_0": {"nodes": [{"number": 1, "title": "Test PR"}]}}
+        }
         
         result = github.fetch_prs_merged("today")
         
-        assert mock_run_gh.call_count == 2  # 2 orgs
-        assert len(result) == 2
+        assert mock_run_gh.call_count == 1
+        assert len(result) == 1
+
+    @patch('journal_lib.github.run_gh_command')
+    @patch('journal_lib.github.get_date_range')
+    def test_fetch_all(self, mock_get_date, mock_run_gh):
+        """Test fetching all categories with a single GraphQL request."""
+        mock_get_date.return_value = "2023-12-01"
+        node = {"number": 1, "title": "Item", "url": "https://github.com/o/r/issues/1"}
+        keys = ["issues_created", "prs_created", "issues_worked_on", "issues_closed", "prs_merged"]
+        aliases = [f"{key}_0" for key in keys] + ["issues_closed_1"]
+        mock_run_gh.return_value = {"data": {alias: {"nodes": [dict(node)]} for alias in aliases}}
+        
+        result = github.fetch_all("today")
+        
+        assert set(result) == set(keys)
+        assert mock_run_gh.call_count == 1
+        query = mock_run_gh.call_args[0][0][4]
+        for alias in aliases:
+            assert f"{alias}: search(" in query
+        for items in result.values():
+            assert len(items) == 1
+
+    @patch('journal_lib.github.run_gh_command')
+    @patch('journal_lib.github.get_date_range')
+    def test_fetch_truncated_results_warn(self, mock_get_date, mock_run_gh, capsys):
+        """Test that a warning is printed when a search has more results than fetched."""
+        mock_get_date.return_value = "2023-12-01"
+        mock_run_gh.return_value = {
+            "data": {"prs_merged_0": {"issueCount": 150, "nodes": [{"number": 1}]}}
+        }
+        
+        result = github.fetch_prs_merged("today")
+        
+        assert len(result) == 1
+        assert "prs_merged shows only 1 of 150 results" in capsys.readouterr().err
+
+    @patch('journal_lib.github.run_gh_command')
+    @patch('journal_lib.github.get_date_range')
+    def test_fetch_all_error(self, mock_get_date, mock_run_gh):
+        """Test that a failed request yields empty categories."""
+        mock_get_date.return_value = "2023-12-01"
+        mock_run_gh.return_value = {}
+        
+        result = github.fetch_all("today")
+        
+        assert all(items == [] for items in result.values())
 
 
 class TestSecurityFunctions:
@@ -265,8 +391,9 @@ class TestSecurityFunctions:
         """Test basic markdown escaping."""
         text = "This has *bold* and [link](url) and `code`"
         result = github.escape_markdown(text)
-        expected = "This has \\\\*bold\\\\* and \\\\[link\\\\]\\\\(url\\\\) and \\\\`code\\\\`"
+        expected = "This has \\*bold\\* and \\[link\\]\\(url\\) and \\`code\\`"
         assert result == expected
+        assert github.escape_markdown("C:\\temp") == "C:\\\\temp"
 
 
     def test_escape_markdown_non_string(self):
@@ -283,40 +410,26 @@ class TestSecurityFunctions:
 class TestRepositoryExtraction:
     """Test repository extraction from URLs."""
 
-    def test_extract_repo_from_url_issue(self):
-        """Test extracting repository from issue URL."""
-        url = "https://github.com/owner/repo/issues/123"
-        result = github.extract_repo_from_url(url)
-        assert result == "owner/repo"
-
-    def test_extract_repo_from_url_pr(self):
-        """Test extracting repository from PR URL."""
-        url = "https://github.com/digitalgedacht/careassist-odoo/pull/456"
-        result = github.extract_repo_from_url(url)
-        assert result == "digitalgedacht/careassist-odoo"
-
-    def test_extract_repo_from_url_invalid(self):
-        """Test extracting repository from invalid URL."""
-        url = "https://not-github.com/something"
-        result = github.extract_repo_from_url(url)
-        assert result == "unknown/repo"
-
-    def test_extract_repo_from_url_non_string(self):
-        """Test extracting repository from non-string input."""
-        result = github.extract_repo_from_url(123)
-        assert result == "unknown/repo"
-
-    def test_extract_repo_from_url_malformed(self):
-        """Test extracting repository from malformed URL."""
-        url = "not-a-url-at-all"
-        result = github.extract_repo_from_url(url)
-        assert result == "unknown/repo"
-
-    def test_extract_repo_from_url_with_www(self):
-        """Test extracting repository from GitHub URL with www prefix."""
-        url = "https://www.github.com/owner/repo/issues/123"
-        result = github.extract_repo_from_url(url)
-        assert result == "owner/repo"
+    @pytest.mark.parametrize("url,expected", [
+        pytest.param("https://github.com/owner/repo/issues/123", "owner/repo", id="issue"),
+        pytest.param("https://github.com/digitalgedacht/careassist-odoo/pull/456",
+                     "digitalgedacht/careassist-odoo", id="pr"),
+        pytest.param("https://www.github.com/owner/repo/issues/123", "owner/repo", id="with-www"),
+        pytest.param("https://not-github.com/something", "unknown/repo", id="invalid"),
+        pytest.param("not-a-url-at-all", "unknown/repo", id="malformed"),
+        # Hosts merely starting with github.com are rejected
+        pytest.param("https://github.com.evil.example/owner/repo/issues/123", "unknown/repo",
+                     id="lookalike-host"),
+        # github.com appearing later in the URL is not accepted
+        pytest.param("https://example.com/github.com/owner/repo", "unknown/repo",
+                     id="other-host-with-github-path"),
+        # Non-string input of any type is rejected, including unhashable values
+        pytest.param(123, "unknown/repo", id="non-string"),
+        pytest.param(["not", "a", "url"], "unknown/repo", id="unhashable"),
+    ])
+    def test_extract_repo_from_url(self, url, expected):
+        """Test extracting the owner/repo part from GitHub issue and PR URLs."""
+        assert github.extract_repo_from_url(url) == expected
 
 
 class TestFormatting:
@@ -343,7 +456,7 @@ class TestFormatting:
             "state": "open"
         }
         result = github.format_issue_ref(issue)
-        expected = "[owner/repo#123](https://github.com/owner/repo/issues/123) -- Fix \\\\*bold\\\\* issue with \\\\[links\\\\]"
+        expected = "[owner/repo#123](https://github.com/owner/repo/issues/123) -- Fix \\*bold\\* issue with \\[links\\]"
         assert result == expected
 
     def test_format_issue_ref_closed(self):
@@ -379,7 +492,7 @@ class TestFormatting:
             "createdAt": "2023-12-01T10:00:00Z"
         }
         result = github.format_pr_ref(pr)
-        expected = "[owner/repo#456](https://github.com/owner/repo/pull/456) -- Add \\\\`code\\\\` support for \\\\*features\\\\* (opened 2023-12-01 10:00)"
+        expected = "[owner/repo#456](https://github.com/owner/repo/pull/456) -- Add \\`code\\` support for \\*features\\* (opened 2023-12-01 10:00)"
         assert result == expected
 
     def test_format_pr_ref_merged(self):
@@ -396,6 +509,19 @@ class TestFormatting:
         assert result == expected
 
 
+    def test_format_pr_ref_non_github_timestamp_format(self):
+        """Test formatting PR reference with a timestamp GitHub does not usually return."""
+        pr = {
+            "number": 456,
+            "title": "Test PR",
+            "url": "https://github.com/owner/repo/pull/456",
+            "createdAt": "2023-12-01 10:00:00+00:00"
+        }
+        result = github.format_pr_ref(pr)
+        expected = "[owner/repo#456](https://github.com/owner/repo/pull/456) -- Test PR (opened 2023-12-01 10:00)"
+        assert result == expected
+
+
 class TestContentFormatting:
     """Test content formatting and GitHub reference updating."""
 
@@ -443,24 +569,81 @@ class TestContentFormatting:
     def test_format_unformatted_github_refs(self, mock_run_gh_single):
         """Test formatting unformatted GitHub references with repository prefix."""
         content = "Fixed Issue #123 and PR #456"
-        mock_run_gh_single.side_effect = [
-            {
-                "number": 123,
-                "title": "Test Issue",
-                "url": "https://github.com/owner/repo/issues/123",
-                "state": "closed"
-            },
-            {
-                "number": 456, 
-                "title": "Test PR",
-                "url": "https://github.com/owner/repo/pull/456",
-                "state": "open"
+        mock_run_gh_single.return_value = {
+            "data": {
+                "repository": {
+                    "n123": {
+                        "title": "Test Issue",
+                        "url": "https://github.com/owner/repo/issues/123",
+                        "state": "CLOSED"
+                    },
+                    "n456": {
+                        "title": "Test PR",
+                        "url": "https://github.com/owner/repo/pull/456",
+                        "state": "OPEN"
+                    }
+                }
             }
-        ]
+        }
         
         result = github.format_unformatted_github_refs(content, "owner/repo")
         expected = "Fixed [owner/repo#123](https://github.com/owner/repo/issues/123) -- ✅ Test Issue and [owner/repo#456](https://github.com/owner/repo/pull/456) -- Test PR"
         assert result == expected
+        # All references are resolved with a single GraphQL query
+        mock_run_gh_single.assert_called_once()
+        cmd = mock_run_gh_single.call_args[0][0]
+        assert cmd[:3] == ["gh", "api", "graphql"]
+        assert "owner=owner" in cmd and "name=repo" in cmd
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_format_all_github_refs_graphql_failure_not_repeated(self, mock_run_gh_single):
+        """Test that a failed GraphQL batch is neither resent by later passes nor retried per reference."""
+        content = "[Issue #1](https://github.com/owner/repo/issues/1) -- Old\nFixed Issue #123 and PR #456"
+        mock_run_gh_single.return_value = {}  # GraphQL query failed
+        
+        result = github.format_all_github_refs(content, repo="owner/repo")
+        
+        assert result == content
+        mock_run_gh_single.assert_called_once()
+        assert mock_run_gh_single.call_args[0][0][:3] == ["gh", "api", "graphql"]
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_format_unformatted_github_refs_partial_graphql_result(self, mock_run_gh_single):
+        """Test that references resolved by a partially failed batch are still formatted."""
+        content = "Fixed Issue #123 and Issue #999"
+        mock_run_gh_single.return_value = {
+            "data": {
+                "repository": {
+                    "n123": {
+                        "title": "Test Issue",
+                        "url": "https://github.com/owner/repo/issues/123",
+                        "state": "OPEN"
+                    },
+                    "n999": None
+                }
+            }
+        }
+        
+        result = github.format_unformatted_github_refs(content, "owner/repo")
+        
+        assert result == "Fixed [owner/repo#123](https://github.com/owner/repo/issues/123) -- Test Issue and Issue #999"
+        mock_run_gh_single.assert_called_once()
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_format_unformatted_github_refs_repeated_ref_fetched_once(self, mock_run_gh_single):
+        """Test that a reference occurring several times is looked up only once."""
+        content = "Issue #123 first, Issue #123 again"
+        mock_run_gh_single.return_value = {
+            "number": 123,
+            "title": "Test Issue",
+            "url": "https://github.com/owner/repo/issues/123",
+            "state": "open"
+        }
+        
+        result = github.format_unformatted_github_refs(content, "owner/repo")
+        
+        assert result.count("[owner/repo#123](https://github.com/owner/repo/issues/123) -- Test Issue") == 2
+        mock_run_gh_single.assert_called_once()
 
     @patch('journal_lib.github.run_gh_command')
     def test_format_unformatted_github_refs_dry_run(self, mock_run_gh_single):
@@ -474,36 +657,177 @@ class TestContentFormatting:
             mock_print.assert_called_once()
             mock_run_gh_single.assert_not_called()
 
+    @patch('journal_lib.github.run_gh_command')
     @patch('journal_lib.github.detect_repo_from_content')
-    @patch('journal_lib.github.add_checkmarks_to_closed_issues')
-    @patch('journal_lib.github.format_unformatted_github_refs')
-    def test_format_all_github_refs(self, mock_format_unformatted, mock_add_checkmarks, mock_detect_repo):
-        """Test comprehensive GitHub reference formatting."""
-        content = "Some content"
+    def test_format_all_github_refs(self, mock_detect_repo, mock_run_gh):
+        """Test comprehensive GitHub reference formatting in a single pass."""
+        content = "[Issue #123](https://github.com/owner/repo/issues/123) -- Old Issue\nFixed PR #456"
         mock_detect_repo.return_value = "owner/repo"
-        mock_add_checkmarks.return_value = "content with checkmarks"
-        mock_format_unformatted.return_value = "final formatted content"
+        mock_run_gh.return_value = {
+            "data": {
+                "repository": {
+                    "n123": {
+                        "title": "Old Issue",
+                        "url": "https://github.com/owner/repo/issues/123",
+                        "state": "CLOSED"
+                    },
+                    "n456": {
+                        "title": "Test PR",
+                        "url": "https://github.com/owner/repo/pull/456",
+                        "state": "OPEN"
+                    }
+                }
+            }
+        }
         
         result = github.format_all_github_refs(content)
         
         mock_detect_repo.assert_called_once_with(content)
-        mock_add_checkmarks.assert_called_once_with(content, "owner/repo", False)
-        mock_format_unformatted.assert_called_once_with("content with checkmarks", "owner/repo", False)
-        assert result == "final formatted content"
+        mock_run_gh.assert_called_once()  # One batched lookup for both references
+        assert result == (
+            "[owner/repo#123](https://github.com/owner/repo/issues/123) -- ✅ Old Issue\n"
+            "Fixed [owner/repo#456](https://github.com/owner/repo/pull/456) -- Test PR"
+        )
 
-    @patch('journal_lib.github.add_checkmarks_to_closed_issues')
-    @patch('journal_lib.github.format_unformatted_github_refs')
-    def test_format_all_github_refs_with_repo(self, mock_format_unformatted, mock_add_checkmarks):
+    @patch('journal_lib.github.run_gh_command')
+    def test_format_all_github_refs_with_repo(self, mock_run_gh):
         """Test comprehensive GitHub reference formatting with provided repo."""
-        content = "Some content"
-        mock_add_checkmarks.return_value = "content with checkmarks"
-        mock_format_unformatted.return_value = "final formatted content"
+        content = "Fixed Issue #123"
+        mock_run_gh.return_value = {
+            "number": 123,
+            "title": "Test Issue",
+            "url": "https://github.com/specified/repo/issues/123",
+            "state": "open"
+        }
         
         result = github.format_all_github_refs(content, repo="specified/repo")
         
-        mock_add_checkmarks.assert_called_once_with(content, "specified/repo", False)
-        mock_format_unformatted.assert_called_once_with("content with checkmarks", "specified/repo", False)
-        assert result == "final formatted content"
+        cmd = mock_run_gh.call_args[0][0]
+        assert cmd[cmd.index("--repo") + 1] == "specified/repo"
+        assert result == "Fixed [specified/repo#123](https://github.com/specified/repo/issues/123) -- Test Issue"
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_format_all_github_refs_ref_after_issue_link(self, mock_run_gh):
+        """Test plain references following an unchecked issue link on the same line are formatted."""
+        content = "- [Issue #1](https://github.com/o/r/issues/1) -- Fix bug, see Issue #2 and PR #3"
+        mock_run_gh.return_value = {
+            "data": {
+                "repository": {
+                    "n1": {"title": "T1", "url": "https://github.com/o/r/issues/1", "state": "CLOSED"},
+                    "n2": {"title": "T2", "url": "https://github.com/o/r/issues/2", "state": "CLOSED"},
+                    "n3": {"title": "T3", "url": "https://github.com/o/r/pull/3", "state": "OPEN"},
+                }
+            }
+        }
+        
+        result = github.format_all_github_refs(content, repo="o/r")
+        
+        assert result == (
+            "- [o/r#1](https://github.com/o/r/issues/1) -- ✅ Fix bug, see "
+            "[o/r#2](https://github.com/o/r/issues/2) -- ✅ T2 and "
+            "[o/r#3](https://github.com/o/r/pull/3) -- T3"
+        )
+        # References of both passes are resolved in a single batch
+        mock_run_gh.assert_called_once()
+
+    @patch('journal_lib.github.run_gh_command')
+    @patch('journal_lib.github.detect_repo_from_content')
+    def test_format_all_github_refs_without_refs(self, mock_detect_repo, mock_run_gh):
+        """Test that content without references is returned without any lookups."""
+        content = "Just notes, no references"
+        
+        result = github.format_all_github_refs(content)
+        
+        assert result is content
+        mock_detect_repo.assert_not_called()
+        mock_run_gh.assert_not_called()
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_format_all_github_refs_dry_run(self, mock_run_gh):
+        """Test dry run mode reports both kinds of references without lookups."""
+        content = "[Issue #123](https://github.com/owner/repo/issues/123) -- Old Issue\nFixed PR #456"
+        
+        with patch('builtins.print') as mock_print:
+            result = github.format_all_github_refs(content, repo="owner/repo", dry_run=True)
+        
+        assert result == content
+        assert mock_print.call_count == 2
+        mock_run_gh.assert_not_called()
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_format_all_github_refs_large_note(self, mock_run_gh):
+        """Test a note with many references uses precompiled patterns and one lookup."""
+        content = "Fixed Issue #1 " * 1000
+        mock_run_gh.return_value = {
+            "number": 1,
+            "title": "x",
+            "url": "https://github.com/o/r/issues/1",
+            "state": "open"
+        }
+        
+        # Patterns must stay compiled at import time: any call into the re module
+        # from github.py, e.g. re.sub() with a pattern string, fails the test
+        compiling_calls = ("compile", "search", "match", "fullmatch", "sub", "subn", "finditer", "findall", "split")
+        re_stub = Mock(**{
+            f"{name}.side_effect": AssertionError(f"re.{name}() called while formatting")
+            for name in compiling_calls
+        })
+        with patch.object(github, 're', re_stub):
+            result = github.format_all_github_refs(content, repo="o/r")
+        
+        assert result.count("[o/r#1](https://github.com/o/r/issues/1) -- x") == 1000
+        mock_run_gh.assert_called_once()
+
+
+class TestRefDiskCache:
+    """Test the on-disk cache of issue and PR lookups."""
+
+    ISSUE = {
+        "number": 123,
+        "title": "Test Issue",
+        "url": "https://github.com/owner/repo/issues/123",
+        "state": "closed"
+    }
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_lookup_reused_across_runs(self, mock_run_gh):
+        """Test that a later run reads the lookup from disk instead of calling gh."""
+        mock_run_gh.return_value = self.ISSUE
+        first = github.format_unformatted_github_refs("Issue #123", "owner/repo")
+        
+        github._gh_view_cache.clear()  # Simulate a new process
+        second = github.format_unformatted_github_refs("Issue #123", "owner/repo")
+        
+        assert first == second
+        mock_run_gh.assert_called_once()
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_no_cache_bypasses_disk(self, mock_run_gh):
+        """Test that use_cache=False looks the reference up again."""
+        mock_run_gh.return_value = self.ISSUE
+        github.format_all_github_refs("Issue #123", repo="owner/repo")
+        
+        github._gh_view_cache.clear()
+        github.format_all_github_refs("Issue #123", repo="owner/repo", use_cache=False)
+        
+        assert mock_run_gh.call_count == 2
+
+    @patch('journal_lib.github.run_gh_command')
+    def test_open_issue_expires(self, mock_run_gh):
+        """Test that cached open issues expire after the short TTL."""
+        mock_run_gh.return_value = dict(self.ISSUE, state="open")
+        github.format_unformatted_github_refs("Issue #123", "owner/repo")
+        
+        github._gh_view_cache.clear()
+        with patch('journal_lib.github.time.time', return_value=github.time.time() + 301):
+            github.format_unformatted_github_refs("Issue #123", "owner/repo")
+        
+        assert mock_run_gh.call_count == 2
+
+    def test_unsafe_repo_not_cached(self):
+        """Test that repository names are validated before building cache paths."""
+        assert github._ref_cache_file("issue", "123", "../../etc") is None
+        assert github._ref_cache_file("issue", "123", "owner/repo") is not None
 
 
 class TestDeduplication:
@@ -595,10 +919,22 @@ class TestDeduplication:
         assert issue_456["title"] == "Another Issue"  # Original, not "Updated"
 
 
+@pytest.fixture(scope="module")
+def empty_github_data():
+    """GitHub data with every Daily Review category empty, read-only so tests cannot leak changes."""
+    return MappingProxyType({
+        "issues_created": (),
+        "prs_created": (),
+        "issues_closed": (),
+        "issues_worked_on": (),
+        "prs_merged": (),
+    })
+
+
 class TestDailyReviewUpdate:
     """Test daily review section updating."""
 
-    def test_update_daily_review_section_replace_existing(self):
+    def test_update_daily_review_section_replace_existing(self, empty_github_data):
         """Test replacing existing Daily Review section."""
         content = """# Some Title
 
@@ -611,11 +947,8 @@ Old content here
 Other content"""
         
         github_data = {
+            **empty_github_data,
             "issues_created": [{"number": 1, "title": "Test", "url": "http://test.com", "state": "open"}],
-            "prs_created": [],
-            "issues_closed": [],
-            "issues_worked_on": [],
-            "prs_merged": []
         }
         
         result = github.update_daily_review_section(content, github_data)
@@ -627,19 +960,44 @@ Other content"""
         assert "## Other Section" in result
         assert "Old content here" not in result
 
-    def test_update_daily_review_section_append_new(self):
+    def test_update_daily_review_section_replace_keeps_escapes(self):
+        """Test that escaped titles are written with single backslashes when replacing or appending."""
+        github_data = {
+            "issues_created": [
+                {"number": 1, "title": "Fix *bold*", "url": "https://github.com/o/r/issues/1", "state": "open"}
+            ]
+        }
+        expected_line = "- [o/r#1](https://github.com/o/r/issues/1) -- Fix \\*bold\\*\n"
+        
+        replaced = github.update_daily_review_section("## Daily Review\n\nOld content here", github_data)
+        appended = github.update_daily_review_section("# Day", github_data)
+        
+        assert expected_line in replaced
+        assert "Old content here" not in replaced
+        assert expected_line in appended
+
+    def test_update_daily_review_section_boundaries(self):
+        """Test that replacement stops at the next heading and keeps a final newline."""
+        empty = {}
+        before_sub = "## Daily Review\n\nOld\nlines\n### Notes\nkeep\n"
+        at_end = "# Day\n\n## Daily Review\n\nOld\n"
+        
+        result_sub = github.update_daily_review_section(before_sub, empty)
+        result_end = github.update_daily_review_section(at_end, empty)
+        
+        assert result_sub.endswith("NONE\n\n### Notes\nkeep\n")
+        assert "Old" not in result_sub
+        assert result_end.startswith("# Day\n\n## Daily Review\n\n")
+        assert result_end.endswith("NONE\n\n")
+        assert "Old" not in result_end
+
+    def test_update_daily_review_section_append_new(self, empty_github_data):
         """Test appending Daily Review section when it doesn't exist."""
         content = """# Some Title
 
 Some existing content"""
         
-        github_data = {
-            "issues_created": [],
-            "prs_created": [],
-            "issues_closed": [],
-            "issues_worked_on": [],
-            "prs_merged": []
-        }
+        github_data = empty_github_data
         
         result = github.update_daily_review_section(content, github_data)
         
@@ -669,21 +1027,18 @@ Some existing content"""
         assert "[unknown/repo#5](http://test.com/5) -- Merged PR" in result
         assert "NONE" not in result  # No sections should be empty
 
-    def test_update_daily_review_section_deduplicates_multiple_runs(self):
+    def test_update_daily_review_section_deduplicates_multiple_runs(self, empty_github_data):
         """Test that multiple runs of daily update don't create duplicate entries."""
         content = "# Daily Notes"
         
         # Simulate duplicate data from multiple API calls (realistic scenario)
         github_data = {
+            **empty_github_data,
             "issues_created": [
                 {"number": 123, "title": "Fix bug", "url": "https://github.com/owner/repo/issues/123", "state": "open"},
                 {"number": 123, "title": "Fix bug", "url": "https://github.com/owner/repo/issues/123", "state": "open"},  # Duplicate
                 {"number": 456, "title": "Add feature", "url": "https://github.com/other/repo/issues/456", "state": "open"},
             ],
-            "prs_created": [],
-            "issues_closed": [],
-            "issues_worked_on": [],
-            "prs_merged": []
         }
         
         result = github.update_daily_review_section(content, github_data)
@@ -697,21 +1052,18 @@ Some existing content"""
         owner_repo_pos = result.find("[owner/repo#123]")
         assert other_repo_pos < owner_repo_pos  # "other" comes before "owner" alphabetically
 
-    def test_update_daily_review_section_sorts_by_repository(self):
+    def test_update_daily_review_section_sorts_by_repository(self, empty_github_data):
         """Test that GitHub items are sorted by repository and issue number for cleaner display."""
         content = "# Daily Notes"
         
         # Unsorted input data from different repositories
         github_data = {
+            **empty_github_data,
             "issues_created": [
                 {"number": 999, "title": "Zoo repo issue", "url": "https://github.com/zoo/repo/issues/999", "state": "open"},
                 {"number": 456, "title": "Alpha repo later", "url": "https://github.com/alpha/repo/issues/456", "state": "open"},
                 {"number": 123, "title": "Alpha repo earlier", "url": "https://github.com/alpha/repo/issues/123", "state": "open"},
             ],
-            "prs_created": [],
-            "issues_closed": [], 
-            "issues_worked_on": [],
-            "prs_merged": []
         }
         
         result = github.update_daily_review_section(content, github_data)
@@ -1,5 +1,7 @@
 """Tests for journal_lib.result module."""
 
+import dataclasses
+
 import pytest
 
 from journal_lib.result import Result, Success, Failure
@@ -34,4 +36,29 @@ class TestResult:
 
         dict_success = Success({"key": "value"})
         assert dict_success.value == {"key": "value"}
-        assert dict_success.is_success() == True
\ No newline at end of file
+        assert dict_success.is_success() == True
+
+    def test_results_have_no_instance_dict(self):
+        """Test Success and Failure only store their single attribute."""
+        assert not hasattr(Success("value"), "__dict__")
+        assert not hasattr(Failure("error"), "__dict__")
+
+    def test_results_support_pattern_matching(self):
+        """Test Success and Failure can be destructured in match statements."""
+        def describe(result: Result[int]) -> str:
+            match result:
+                case Success(value):
+                    return f"value {value}"
+                case Failure(error):
+                    return f"error {error}"
+
+        assert describe(Success(42)) == "value 42"
+        assert describe(Failure("boom")) == "error boom"
+
+    def test_results_are_immutable_values(self):
+        """Test results compare by value and cannot be modified."""
+        assert Success(1) == Success(1)
+        assert Failure("error") != Failure("other error")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Success(1).value = 2